@@ -1,24 +1,60 @@
 import os
+import asyncio
 import json
+import math
 import time
-from typing import Any, Dict, Optional
-
-from fastapi import FastAPI, HTTPException, Depends, Header, APIRouter
+import hmac
+import hashlib
+import logging
+import threading
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+
+from fastapi import FastAPI, HTTPException, Depends, Header, APIRouter, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from passlib.context import CryptContext
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+import msgspec
+import bcrypt
 import jwt
 
+logger = logging.getLogger(__name__)
+
 # ============================================================
 # ENV
 # ============================================================
 TOKEN_SECRET = os.environ.get("TOKEN_SECRET", "change-me")
 SUPERADMIN_ID = os.environ.get("SUPERADMIN_ID", "dldydtjq159")
 SUPERADMIN_PW = os.environ.get("SUPERADMIN_PW", "tkfkd4026")
+# bcrypt cost for new hashes; existing hashes carry their own cost and keep verifying
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
 
 JWT_ALG = "HS256"
+# encoded once; PyJWT accepts bytes keys and skips its own str->bytes step
+_SECRET_BYTES = TOKEN_SECRET.encode("utf-8")
+_JWT_ALGS = [JWT_ALG]
+# one configured decoder; aud/iss are never issued here, so skip those checks
+_jwt = jwt.PyJWT(options={"require": ["exp"], "verify_aud": False, "verify_iss": False})
 JWT_TTL_SEC = 60 * 60 * 12  # 12h
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _hash_pw(pw: str) -> str:
+    return bcrypt.hashpw(pw.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
+
+def _check_pw(pw: str, pw_hash: str) -> bool:
+    try:
+        return bcrypt.checkpw(pw.encode("utf-8"), pw_hash.encode("ascii"))
+    except ValueError:
+        return False
+
+# Short-lived caches of successful verifications (failures are never cached)
+_login_cache: TTLCache = TTLCache(maxsize=2048, ttl=10)
+_login_lock = threading.Lock()
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+_token_lock = threading.Lock()
 
 # ============================================================
 # Storage (simple JSON file; Railway filesystem is ephemeral)
@@ -26,29 +62,103 @@ pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
 DATA_FILE = os.environ.get("DATA_FILE", "data.json")
 ADMINS_FILE = os.environ.get("ADMINS_FILE", "admins.json")
 
+# path -> (st_mtime_ns, st_size, parsed); cached values are shared, treat as read-only
+_json_cache: Dict[str, Tuple[int, int, Any]] = {}
+
 def _read_json(path: str, default: Any):
+    # a single stat() per request; the file is only re-read when it changed.
+    # Parsed with stdlib json: it is exact for ints beyond 64 bits and accepts
+    # NaN/Infinity, both of which older versions of this server wrote.
+    try:
+        st = os.stat(path)
+        cached = _json_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, "rb") as f:
+            obj = json.loads(f.read())
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError):
+        logger.exception("cannot read %s, using defaults", path)
+        return default
+    _json_cache[path] = (st.st_mtime_ns, st.st_size, obj)
+    return obj
+
+_JSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _orjson_exact(obj: Any) -> bool:
+    """False if obj holds values orjson can't write as stdlib json did (NaN/Infinity, ints beyond 64 bits)."""
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        t = type(o)
+        if t is dict:
+            stack.extend(o.values())
+        elif t is list:
+            stack.extend(o)
+        elif t is float:
+            if not math.isfinite(o):
+                return False
+        elif t is int:
+            if not -(1 << 63) <= o < (1 << 64):
+                return False
+    return True
+
+def _encode_json(obj: Any) -> bytes:
+    # orjson rejects some values stdlib json wrote (e.g. ints beyond 64 bits);
+    # refuse them up front with a 422 instead of failing at write time
     try:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except:
-        pass
-    return default
-
-def _write_json(path: str, obj: Any):
+        return orjson.dumps(obj, option=_JSON_OPTS)
+    except orjson.JSONEncodeError as e:
+        raise HTTPException(status_code=422, detail=[{"loc": ["body"], "msg": f"Unsupported value: {e}"}])
+
+def _write_json(path: str, obj: Any, exact: bool = False, encoded: Optional[bytes] = None):
+    # exact=True keeps stdlib json for documents _orjson_exact() rejects;
+    # encoded lets a caller that already serialized obj skip a second encode
+    if encoded is not None:
+        data = encoded
+    elif exact:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    else:
+        data = orjson.dumps(obj, option=_JSON_OPTS)
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(data)
     os.replace(tmp, path)
+    st = os.stat(path)
+    _json_cache[path] = (st.st_mtime_ns, st.st_size, obj)
+
+# Fallback used only when ADMINS_FILE is missing or unreadable, so a normal start
+# never pays the superadmin bcrypt. Built once on first use; treat as read-only.
+@lru_cache(maxsize=None)
+def _default_admins() -> Dict[str, Any]:
+    pw_hash = os.environ.get("SUPERADMIN_PW_HASH") or _hash_pw(SUPERADMIN_PW)
+    return {"superadmin": {"id": SUPERADMIN_ID, "pw_hash": pw_hash}, "admins": []}
+
+def _load_admins() -> Dict[str, Any]:
+    admins_obj = _read_json(ADMINS_FILE, None)
+    return admins_obj if admins_obj is not None else _default_admins()
+
+def _find_user(admins_obj: Dict[str, Any], user_id: str):
+    """Return (role, record) for user_id, or (None, None)."""
+    sup = admins_obj.get("superadmin", {})
+    if user_id == sup.get("id"):
+        return "superadmin", sup
+    for a in admins_obj.get("admins", []):
+        if user_id == a.get("id"):
+            return "admin", a
+    return None, None
 
 def _ensure_files():
+    # directories are created once here, never on the request path
+    for path in (DATA_FILE, ADMINS_FILE):
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
     if not os.path.exists(DATA_FILE):
         _write_json(DATA_FILE, {"stores": ["김경영 요리 연구소", "청년회관"], "byStore": {}, "lastSync": ""})
     if not os.path.exists(ADMINS_FILE):
-        _write_json(ADMINS_FILE, {
-            "superadmin": {"id": SUPERADMIN_ID, "pw_hash": pwd_ctx.hash(SUPERADMIN_PW)},
-            "admins": []
-        })
+        _write_json(ADMINS_FILE, _default_admins())
 
 _ensure_files()
 
@@ -58,10 +168,38 @@ _ensure_files()
 def _make_token(user_id: str, role: str) -> str:
     now = int(time.time())
     payload = {"sub": user_id, "role": role, "iat": now, "exp": now + JWT_TTL_SEC}
-    return jwt.encode(payload, TOKEN_SECRET, algorithm=JWT_ALG)
+    return _jwt.encode(payload, _SECRET_BYTES, algorithm=JWT_ALG)
 
 def _decode_token(token: str) -> Dict[str, Any]:
-    return jwt.decode(token, TOKEN_SECRET, algorithms=[JWT_ALG])
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _token_lock:
+        hit = _token_cache.get(key)
+    # exp is re-checked on every hit so a cached token never outlives its expiry
+    if hit is not None and hit[1] > time.time():
+        return hit[0]
+    payload = _jwt.decode(token, _SECRET_BYTES, algorithms=_JWT_ALGS)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _token_lock:
+            _token_cache[key] = (payload, exp)
+    return payload
+
+def _login_key(user_id: str, pw: str) -> bytes:
+    return hashlib.sha256(f"{user_id}|{pw}".encode("utf-8")).digest()
+
+async def _verify_login(user_id: str, pw: str, role: str, pw_hash: str) -> bool:
+    key = _login_key(user_id, pw)
+    with _login_lock:
+        hit = _login_cache.get(key)
+    # the stored hash is part of the entry so a changed password misses the cache
+    if hit is not None and hit[0] == role and hmac.compare_digest(hit[1], pw_hash):
+        return True
+    # bcrypt releases the GIL, so keep it off the event loop
+    if not pw_hash or not await run_in_threadpool(_check_pw, pw, pw_hash):
+        return False
+    with _login_lock:
+        _login_cache[key] = (role, pw_hash)
+    return True
 
 def get_bearer_token(authorization: Optional[str] = Header(None)) -> Optional[str]:
     if not authorization:
@@ -92,22 +230,32 @@ def require_role(required: str):
 # ============================================================
 # Data normalization
 # ============================================================
+_INVENTORY_CATEGORIES = ("닭", "떡", "소스", "포장재")
+_RECIPE_CATEGORIES = ("치킨", "떡볶이", "파스타", "사이드", "가게부")
+
 def default_store_data():
     return {
-        "inventory": {"닭": [], "떡": [], "소스": [], "포장재": []},
-        "recipes": {"치킨": {}, "떡볶이": {}, "파스타": {}, "사이드": {}, "가게부": {}},
+        "inventory": {c: [] for c in _INVENTORY_CATEGORIES},
+        "recipes": {c: {} for c in _RECIPE_CATEGORIES},
         "memo": "",
         "ledger": []
     }
 
 def normalize_store(st: Any) -> Dict[str, Any]:
+    # already well-formed (the common case): hand it back as is
+    if (isinstance(st, dict)
+            and isinstance(st.get("inventory"), dict)
+            and isinstance(st.get("recipes"), dict)
+            and isinstance(st.get("memo"), str)
+            and isinstance(st.get("ledger"), list)):
+        return st
     base = default_store_data()
     if isinstance(st, dict):
         base.update(st)
     if not isinstance(base.get("inventory"), dict):
-        base["inventory"] = default_store_data()["inventory"]
+        base["inventory"] = {c: [] for c in _INVENTORY_CATEGORIES}
     if not isinstance(base.get("recipes"), dict):
-        base["recipes"] = default_store_data()["recipes"]
+        base["recipes"] = {c: {} for c in _RECIPE_CATEGORIES}
     if not isinstance(base.get("memo"), str):
         base["memo"] = ""
     if not isinstance(base.get("ledger"), list):
@@ -118,20 +266,123 @@ def normalize_all(data: Any) -> Dict[str, Any]:
     d = {"stores": ["김경영 요리 연구소", "청년회관"], "byStore": {}, "lastSync": ""}
     if isinstance(data, dict):
         if isinstance(data.get("stores"), list) and data["stores"]:
-            d["stores"] = data["stores"]
+            d["stores"] = list(data["stores"])
         if isinstance(data.get("byStore"), dict):
             d["byStore"] = {k: normalize_store(v) for k, v in data["byStore"].items()}
         if isinstance(data.get("lastSync"), str):
             d["lastSync"] = data["lastSync"]
+    by_store = d["byStore"]
     for s in d["stores"]:
-        d["byStore"].setdefault(s, default_store_data())
-        d["byStore"][s] = normalize_store(d["byStore"][s])
+        if s not in by_store:
+            by_store[s] = default_store_data()
     return d
 
+# ============================================================
+# In-memory data state (flushed to DATA_FILE in the background)
+# ============================================================
+# _state is replaced, never mutated in place, so readers and the flusher
+# can use the current object without holding the lock.
+FLUSH_DELAY_SEC = 0.25
+FLUSH_RETRY_SEC = 5.0
+
+_last_ts = (0, "")
+
+def _now_str() -> str:
+    """Local "%Y-%m-%d %H:%M:%S" timestamp, formatted at most once per second."""
+    global _last_ts
+    t = int(time.time())
+    if t != _last_ts[0]:
+        _last_ts = (t, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t)))
+    return _last_ts[1]
+
+def _make_etag(version: int) -> str:
+    # the boot id keeps a restarted process from reusing an old client's tag
+    return '"%s-%d"' % (_BOOT_ID, version)
+
+_BOOT_ID = os.urandom(6).hex()
+def _load_state() -> Dict[str, Any]:
+    # a DATA_FILE that exists but can't be parsed must never be replaced by the
+    # defaults: the first save would overwrite every store in it
+    try:
+        with open(DATA_FILE, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return normalize_all({})
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise RuntimeError(f"{DATA_FILE} is not valid JSON; fix or move it aside before starting") from e
+    if not isinstance(data, dict):
+        raise RuntimeError(f"{DATA_FILE} does not hold a JSON object; fix or move it aside before starting")
+    return normalize_all(data)
+
+_state: Dict[str, Any] = _load_state()
+# loaded data written by stdlib json that orjson can't reproduce keeps using
+# stdlib json until a full /save replaces it
+_state_exact = not _orjson_exact(_state)
+_state_version = 0
+_state_etag = _make_etag(_state_version)
+_state_lock = asyncio.Lock()
+_write_lock = asyncio.Lock()
+_state_bytes: Optional[bytes] = None
+_state_dirty = False
+_flush_task: Optional[asyncio.Task] = None
+
+async def _flush(retry: bool = True):
+    global _state_dirty
+    # the write lock also makes shutdown wait for a write that is already running
+    async with _write_lock:
+        if not _state_dirty:
+            return
+        _state_dirty = False
+        try:
+            await run_in_threadpool(_write_json, DATA_FILE, _state, _state_exact, _state_bytes)
+        except Exception:
+            logger.exception("failed to write %s", DATA_FILE)
+            _state_dirty = True
+            if retry:
+                _schedule_flush(FLUSH_RETRY_SEC)
+
+async def _flush_later(delay: float):
+    global _flush_task
+    await asyncio.sleep(delay)
+    _flush_task = None
+    await _flush()
+
+def _schedule_flush(delay: float = FLUSH_DELAY_SEC):
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_later(delay))
+
+def _set_state(data: Dict[str, Any], exact: Optional[bool] = None, encoded: Optional[bytes] = None):
+    """Swap in a new state and coalesce the disk write (call under _state_lock).
+
+    `encoded` is data already serialized for DATA_FILE; the flush reuses it.
+    """
+    global _state, _state_bytes, _state_exact, _state_version, _state_etag, _state_dirty
+    _state = data
+    _state_bytes = encoded
+    if exact is not None:
+        _state_exact = exact
+    _state_version += 1
+    _state_etag = _make_etag(_state_version)
+    _state_dirty = True
+    _schedule_flush()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    # write out anything still pending before the process exits
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        _flush_task = None
+    await _flush(retry=False)
+
 # ============================================================
 # FastAPI app
 # ============================================================
-app = FastAPI(title="stock-server + storeapp", version="6.1")
+app = FastAPI(title="stock-server + storeapp", version="6.1", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -157,95 +408,134 @@ def version():
 # ============================================================
 router = APIRouter(prefix="/storeapp/v1", tags=["storeapp"])
 
+def _json_body(model: type):
+    """Dependency that decodes and validates the request body as `model` with msgspec.
+
+    Declare it after any require_role dependency so auth is checked first.
+    Bodies must be strict JSON: NaN/Infinity literals, which the old
+    Pydantic/json.loads path accepted, are rejected with a 422.
+    """
+    async def _dep(request: Request):
+        try:
+            return msgspec.json.decode(await request.body(), type=model)
+        except msgspec.DecodeError as e:
+            # same list shape as FastAPI's own validation errors
+            raise HTTPException(status_code=422, detail=[{"loc": ["body"], "msg": str(e)}])
+    return _dep
+
 @router.get("/version")
 def storeapp_version():
     return {"service": "storeapp", "version": "1.0"}
 
-class LoginReq(BaseModel):
+class LoginReq(msgspec.Struct):
     id: str
     pw: str
 
 @router.post("/auth/login")
-def login(req: LoginReq):
-    admins_obj = _read_json(ADMINS_FILE, {"superadmin": {"id": SUPERADMIN_ID, "pw_hash": pwd_ctx.hash(SUPERADMIN_PW)}, "admins": []})
-    sup = admins_obj.get("superadmin", {})
-    if req.id == sup.get("id") and pwd_ctx.verify(req.pw, sup.get("pw_hash", "")):
-        return {"token": _make_token(req.id, "superadmin"), "role": "superadmin"}
-    for a in admins_obj.get("admins", []):
-        if req.id == a.get("id") and pwd_ctx.verify(req.pw, a.get("pw_hash", "")):
-            return {"token": _make_token(req.id, "admin"), "role": "admin"}
+async def login(req: LoginReq = Depends(_json_body(LoginReq))):
+    admins_obj = await run_in_threadpool(_load_admins)
+    role, user = _find_user(admins_obj, req.id)
+    if role and await _verify_login(req.id, req.pw, role, user.get("pw_hash", "")):
+        return {"token": _make_token(req.id, role), "role": role}
     raise HTTPException(status_code=401, detail="Invalid credentials")
 
 @router.get("/auth/me")
 def me(payload=Depends(require_role("admin"))):
     return {"id": payload.get("sub"), "role": payload.get("role")}
 
-class AdminCreateReq(BaseModel):
+class AdminCreateReq(msgspec.Struct):
     id: str
     pw: str
 
 @router.post("/auth/admins")
-def create_admin(req: AdminCreateReq, _=Depends(require_role("superadmin"))):
+async def create_admin(_=Depends(require_role("superadmin")), req: AdminCreateReq = Depends(_json_body(AdminCreateReq))):
     uid = req.id.strip()
     pw = req.pw.strip()
     if not uid or not pw:
         raise HTTPException(status_code=400, detail="id/pw required")
-    admins_obj = _read_json(ADMINS_FILE, {"superadmin": {"id": SUPERADMIN_ID, "pw_hash": pwd_ctx.hash(SUPERADMIN_PW)}, "admins": []})
-    if uid == admins_obj.get("superadmin", {}).get("id"):
+    admins_obj = await run_in_threadpool(_load_admins)
+    role, _user = _find_user(admins_obj, uid)
+    if role == "superadmin":
         raise HTTPException(status_code=409, detail="Cannot overwrite superadmin")
-    for a in admins_obj.get("admins", []):
-        if a.get("id") == uid:
-            raise HTTPException(status_code=409, detail="Admin already exists")
-    admins_obj["admins"].append({"id": uid, "pw_hash": pwd_ctx.hash(pw), "created_at": int(time.time())})
-    _write_json(ADMINS_FILE, admins_obj)
+    if role:
+        raise HTTPException(status_code=409, detail="Admin already exists")
+    pw_hash = await run_in_threadpool(_hash_pw, pw)
+    # build a new list: admins_obj may be the shared _default_admins()
+    admins_obj = {**admins_obj, "admins": [*admins_obj.get("admins", []), {"id": uid, "pw_hash": pw_hash, "created_at": int(time.time())}]}
+    await run_in_threadpool(_write_json, ADMINS_FILE, admins_obj)
     return {"ok": True}
 
 @router.get("/auth/admins")
 def list_admins(_=Depends(require_role("superadmin"))):
-    admins_obj = _read_json(ADMINS_FILE, {"superadmin": {"id": SUPERADMIN_ID, "pw_hash": ""}, "admins": []})
+    admins_obj = _load_admins()
     return {"admins": [{"id": a.get("id"), "created_at": a.get("created_at")} for a in admins_obj.get("admins", [])]}
 
 # ---- Data endpoints (compatible with PC app) ----
+def _etag_matches(request: Request, etag: str) -> bool:
+    inm = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    return any(t.strip() in ("*", etag, "W/" + etag) for t in inm.split(","))
+
+def _state_response(content: Any, etag: str):
+    cls = JSONResponse if _state_exact else ORJSONResponse
+    return cls(content, headers={"ETag": etag})
+
 @router.get("/data")
-def get_all():
-    return normalize_all(_read_json(DATA_FILE, {}))
+async def get_all(request: Request):
+    etag = _state_etag
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return _state_response(_state, etag)
 
-class SaveAllReq(BaseModel):
+class SaveAllReq(msgspec.Struct):
     data: Dict[str, Any]
 
 @router.post("/save")
-def save_all(req: SaveAllReq, _=Depends(require_role("admin"))):
+async def save_all(_=Depends(require_role("admin")), req: SaveAllReq = Depends(_json_body(SaveAllReq))):
     data = normalize_all(req.data)
-    data["lastSync"] = time.strftime("%Y-%m-%d %H:%M:%S")
-    _write_json(DATA_FILE, data)
+    data["lastSync"] = _now_str()
+    # validate and serialize once, off the event loop; the flush writes these bytes
+    encoded = await run_in_threadpool(_encode_json, data)
+    async with _state_lock:
+        _set_state(data, exact=False, encoded=encoded)
     return {"ok": True}
 
 @router.get("/store/{store_name}")
-def get_store(store_name: str):
-    data = normalize_all(_read_json(DATA_FILE, {}))
-    st = data.get("byStore", {}).get(store_name)
+async def get_store(store_name: str, request: Request):
+    etag = _state_etag
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    st = _state["byStore"].get(store_name)
     if not isinstance(st, dict):
         st = default_store_data()
-    return {"store": store_name, "store_data": normalize_store(st)}
+    return _state_response({"store": store_name, "store_data": normalize_store(st)}, etag)
 
-class SaveStoreReq(BaseModel):
+class SaveStoreReq(msgspec.Struct):
     store_data: Dict[str, Any]
 
 @router.post("/store/{store_name}")
-def save_store(store_name: str, req: SaveStoreReq, _=Depends(require_role("admin"))):
-    data = normalize_all(_read_json(DATA_FILE, {}))
-    data.setdefault("byStore", {})
-    data.setdefault("stores", [])
-    if store_name not in data["stores"]:
-        data["stores"].append(store_name)
-    data["byStore"][store_name] = normalize_store(req.store_data)
-    data["lastSync"] = time.strftime("%Y-%m-%d %H:%M:%S")
-    _write_json(DATA_FILE, data)
+async def save_store(store_name: str, _=Depends(require_role("admin")), req: SaveStoreReq = Depends(_json_body(SaveStoreReq))):
+    st = normalize_store(req.store_data)
+    _encode_json(st)  # validates just this store; the full document is encoded once at flush
+    async with _state_lock:
+        stores = _state["stores"]
+        if store_name not in stores:
+            stores = [*stores, store_name]
+        _set_state({
+            "stores": stores,
+            "byStore": {**_state["byStore"], store_name: st},
+            "lastSync": _now_str(),
+        })
     return {"ok": True}
 
 app.include_router(router)
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     port = int(os.environ.get("PORT", "8080"))
-    uvicorn.run("server:app", host="0.0.0.0", port=port)
+    # data state and auth caches live in-process, so stay at one worker unless told otherwise
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    fast = {} if sys.platform == "win32" else {"loop": "uvloop", "http": "httptools"}
+    uvicorn.run("server:app", host="0.0.0.0", port=port, workers=workers, log_level="warning", **fast)